@@ -250,6 +250,39 @@ def analyze_sales_data(df, detected_cols):
     }
 
 
+def save_analysis(cur, user_id, filename, detected_cols, analysis_results):
+    """Insert an analysis row and return its id (caller commits)"""
+    # Prepare additional metrics JSON
+    additional_metrics = {
+        "top_products": analysis_results.get("top_products", []),
+        "monthly_data": analysis_results.get("monthly_data", []),
+        "daily_data": analysis_results.get("daily_data", []),
+        "day_of_week_data": analysis_results.get("day_of_week_data", [])
+    }
+
+    cur.execute("""
+        INSERT INTO analyses (
+            user_id, filename, date_column, item_column, qty_column, 
+            rate_column, amount_column, total_sales, last_7_days_sales,
+            last_30_days_sales, avg_sales_per_day_week, avg_sales_per_day_month,
+            total_records, growth_rate_week, growth_rate_month, 
+            avg_transaction_value, peak_day, total_quantity, additional_metrics
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        RETURNING id
+    """, (
+        user_id, filename, detected_cols["date"], detected_cols["item"],
+        detected_cols["qty"], detected_cols["rate"], detected_cols["amount"],
+        analysis_results["total_sales"], analysis_results["last_7_days_sales"],
+        analysis_results["last_30_days_sales"], analysis_results["avg_sales_per_day_week"],
+        analysis_results["avg_sales_per_day_month"], analysis_results["total_records"],
+        analysis_results.get("growth_rate_week", 0), analysis_results.get("growth_rate_month", 0),
+        analysis_results.get("avg_transaction_value", 0), analysis_results.get("peak_day"),
+        analysis_results.get("total_quantity"), json.dumps(additional_metrics)
+    ))
+
+    return cur.fetchone()[0]
+
+
 # ---------- ROUTES ----------
 
 @app.route("/")
@@ -384,35 +417,7 @@ def upload():
         conn = get_db()
         cur = conn.cursor()
         
-        # Prepare additional metrics JSON
-        additional_metrics = {
-            "top_products": analysis_results.get("top_products", []),
-            "monthly_data": analysis_results.get("monthly_data", []),
-            "daily_data": analysis_results.get("daily_data", []),
-            "day_of_week_data": analysis_results.get("day_of_week_data", [])
-        }
-        
-        cur.execute("""
-            INSERT INTO analyses (
-                user_id, filename, date_column, item_column, qty_column, 
-                rate_column, amount_column, total_sales, last_7_days_sales,
-                last_30_days_sales, avg_sales_per_day_week, avg_sales_per_day_month,
-                total_records, growth_rate_week, growth_rate_month, 
-                avg_transaction_value, peak_day, total_quantity, additional_metrics
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING id
-        """, (
-            user_id, filename, detected_cols["date"], detected_cols["item"],
-            detected_cols["qty"], detected_cols["rate"], detected_cols["amount"],
-            analysis_results["total_sales"], analysis_results["last_7_days_sales"],
-            analysis_results["last_30_days_sales"], analysis_results["avg_sales_per_day_week"],
-            analysis_results["avg_sales_per_day_month"], analysis_results["total_records"],
-            analysis_results.get("growth_rate_week", 0), analysis_results.get("growth_rate_month", 0),
-            analysis_results.get("avg_transaction_value", 0), analysis_results.get("peak_day"),
-            analysis_results.get("total_quantity"), json.dumps(additional_metrics)
-        ))
-        
-        analysis_id = cur.fetchone()[0]
+        analysis_id = save_analysis(cur, user_id, filename, detected_cols, analysis_results)
         conn.commit()
         cur.close()
         conn.close()
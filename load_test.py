@@ -0,0 +1,638 @@
+"""
+Load test harness for SSDAS.
+
+Starts the Flask app against a throwaway PostgreSQL database,
+seeds it with users and analyses using the schema from setup_database.sql,
+create_analyses_table.sql and update_analyses_table.sql, then drives mixed
+traffic (logins, uploads, history browsing, result pages and PDF exports)
+from concurrent virtual users. Prints p50/p95/p99 latency, throughput and
+error rate per route and exits with status 1 if any threshold is exceeded.
+
+The app runs in a separate Python process so the load generator does not
+compete with it for the GIL, and upload payloads are generated before the
+clock starts. Both still share the machine's CPUs, so compare runs made on
+the same hardware with the same --users/--think-time settings.
+
+Usage:
+    python load_test.py                        # disposable local Postgres (initdb/pg_ctl)
+    python load_test.py --users 20 --duration 120
+    python load_test.py --dsn "host=localhost user=postgres password=password dbname=postgres"
+    python load_test.py --thresholds my_thresholds.json --report report.json
+"""
+
+import argparse
+import http.client
+import io
+import json
+import logging
+import math
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+from http.cookiejar import CookieJar
+from urllib.error import HTTPError
+from urllib.parse import urlencode, urlparse
+from urllib.request import HTTPCookieProcessor, HTTPRedirectHandler, Request, build_opener
+
+import pandas as pd
+import psycopg2
+import psycopg2.extensions
+from werkzeug.security import generate_password_hash
+from werkzeug.serving import make_server
+
+import app as ssdas
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_FILES = ["setup_database.sql", "create_analyses_table.sql", "update_analyses_table.sql"]
+LOADTEST_PASSWORD = "loadtest123"
+
+# Relative weight of each action a virtual user picks between requests
+ACTION_WEIGHTS = {
+    "index": 15,
+    "history": 25,
+    "results": 30,
+    "upload": 10,
+    "export_pdf": 10,
+    "login": 10,
+}
+
+# Route each action is reported under
+ACTION_ROUTES = {
+    "index": "/",
+    "history": "/history",
+    "results": "/results/<id>",
+    "upload": "/upload",
+    "export_pdf": "/export_pdf/<id>",
+    "login": "/login",
+}
+
+# Generated upload sizes (rows) and how often each is picked
+UPLOAD_SIZES = [(50, 60), (500, 30), (5000, 10)]
+
+# Distinct pre-generated files per upload size
+UPLOAD_POOL_SIZE = 10
+
+# Seconds to wait for the app subprocess to start accepting connections
+SERVER_START_TIMEOUT = 30
+
+# Limits that can be set per route, in the order they are checked
+THRESHOLD_KEYS = ("p95_ms", "p99_ms", "max_error_rate")
+
+# Per-route limits; a route breaching any of these fails the run
+DEFAULT_THRESHOLDS = {
+    "/": {"p95_ms": 300, "p99_ms": 800, "max_error_rate": 0.01},
+    "/login": {"p95_ms": 500, "p99_ms": 1000, "max_error_rate": 0.01},
+    "/upload": {"p95_ms": 3000, "p99_ms": 6000, "max_error_rate": 0.02},
+    "/results/<id>": {"p95_ms": 400, "p99_ms": 1000, "max_error_rate": 0.01},
+    "/history": {"p95_ms": 400, "p99_ms": 1000, "max_error_rate": 0.01},
+    "/export_pdf/<id>": {"p95_ms": 1500, "p99_ms": 3000, "max_error_rate": 0.01},
+}
+
+
+# ---------- DISPOSABLE POSTGRES ----------
+
+def find_pg_binary(name):
+    """Locate a PostgreSQL server binary on PATH or in the usual Debian/Ubuntu layout"""
+    path = shutil.which(name)
+    if path:
+        return path
+    pg_root = "/usr/lib/postgresql"
+    if os.path.isdir(pg_root):
+        for version in sorted(os.listdir(pg_root), reverse=True):
+            candidate = os.path.join(pg_root, version, "bin", name)
+            if os.path.exists(candidate):
+                return candidate
+    raise RuntimeError(f"Could not find '{name}'. Install PostgreSQL or pass --dsn to use an existing server.")
+
+
+def get_free_port():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def start_postgres():
+    """Create a fresh cluster in a temp directory and start it on a free port"""
+    data_dir = tempfile.mkdtemp(prefix="ssdas_pg_")
+    port = get_free_port()
+
+    try:
+        subprocess.run(
+            [find_pg_binary("initdb"), "-D", data_dir, "-U", "postgres", "--auth=trust"],
+            check=True, stdout=subprocess.DEVNULL,
+        )
+    except:
+        shutil.rmtree(data_dir, ignore_errors=True)
+        raise
+
+    try:
+        subprocess.run(
+            [
+                find_pg_binary("pg_ctl"), "-D", data_dir, "-w",
+                "-l", os.path.join(data_dir, "server.log"),
+                "-o", f"-p {port} -k {data_dir} -c listen_addresses=127.0.0.1",
+                "start",
+            ],
+            check=True, stdout=subprocess.DEVNULL,
+        )
+    except:
+        # pg_ctl can fail after the postmaster is already up (e.g. -w timeout)
+        stop_postgres(data_dir)
+        raise
+
+    params = {"host": "127.0.0.1", "port": port, "user": "postgres", "dbname": "postgres"}
+    return data_dir, params
+
+
+def stop_postgres(data_dir):
+    try:
+        subprocess.run(
+            [find_pg_binary("pg_ctl"), "-D", data_dir, "-m", "fast", "stop"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+    except (RuntimeError, OSError):
+        # pg_ctl missing or not runnable; nothing was started
+        pass
+    shutil.rmtree(data_dir, ignore_errors=True)
+
+
+# ---------- SCHEMA AND SEED DATA ----------
+
+def read_schema_sql(filename):
+    """Read a setup script, dropping psql meta-commands and CREATE DATABASE"""
+    with open(os.path.join(BASE_DIR, filename)) as f:
+        lines = f.readlines()
+    kept = [
+        line for line in lines
+        if not line.lstrip().startswith("\\")
+        and not line.lstrip().upper().startswith("CREATE DATABASE")
+    ]
+    return "".join(kept)
+
+
+def create_database(server_params, dbname):
+    conn = psycopg2.connect(**server_params)
+    conn.autocommit = True
+    cur = conn.cursor()
+    cur.execute(f'CREATE DATABASE "{dbname}"')
+    cur.close()
+    conn.close()
+
+    db_params = dict(server_params, dbname=dbname)
+    conn = psycopg2.connect(**db_params)
+    cur = conn.cursor()
+    for filename in SCHEMA_FILES:
+        cur.execute(read_schema_sql(filename))
+    conn.commit()
+    cur.close()
+    conn.close()
+    return db_params
+
+
+def drop_database(server_params, dbname):
+    conn = psycopg2.connect(**server_params)
+    conn.autocommit = True
+    cur = conn.cursor()
+    # Kick out any app connections still open so the drop cannot fail with
+    # "being accessed by other users" (works on servers older than PG 13)
+    cur.execute(
+        "SELECT pg_terminate_backend(pid) FROM pg_stat_activity WHERE datname = %s AND pid <> pg_backend_pid()",
+        (dbname,),
+    )
+    cur.execute(f'DROP DATABASE IF EXISTS "{dbname}"')
+    cur.close()
+    conn.close()
+
+
+def generate_sales_csv(rows, rng):
+    """Build a CSV in the same shape as sample_data.csv with dates over the last 60 days"""
+    today = datetime.now().date()
+    products = [f"Product {chr(ord('A') + i)}" for i in range(12)]
+    buf = io.StringIO()
+    buf.write("Date,Item Name,Quantity,Rate,Amount\n")
+    for _ in range(rows):
+        day = today - timedelta(days=rng.randint(0, 59))
+        qty = rng.randint(1, 20)
+        rate = rng.choice([50, 100, 150, 200, 250])
+        buf.write(f"{day.isoformat()},{rng.choice(products)},{qty},{rate},{qty * rate}\n")
+    return buf.getvalue().encode()
+
+
+def seed_database(num_users, analyses_per_user, rng):
+    """Insert users and analyses through the app's own analysis code"""
+    password_hash = generate_password_hash(LOADTEST_PASSWORD)
+    users = []
+
+    conn = ssdas.get_db()
+    cur = conn.cursor()
+    for i in range(num_users):
+        email = f"loadtest{i}@gmail.com"
+        cur.execute(
+            "INSERT INTO users (name, email, password_hash) VALUES (%s, %s, %s) RETURNING id",
+            (f"Load Test {i}", email, password_hash),
+        )
+        user_id = cur.fetchone()[0]
+        analysis_ids = []
+
+        for j in range(analyses_per_user):
+            df = pd.read_csv(io.BytesIO(generate_sales_csv(rng.choice([50, 200, 1000]), rng)))
+            detected_cols = ssdas.detect_columns(df)
+            results = ssdas.analyze_sales_data(df, detected_cols)
+            analysis_ids.append(ssdas.save_analysis(cur, user_id, f"seed_{i}_{j}.csv", detected_cols, results))
+
+        users.append({"email": email, "analysis_ids": analysis_ids})
+
+    conn.commit()
+    cur.close()
+    conn.close()
+    return users
+
+
+# ---------- APP SERVER ----------
+
+def serve_app(port):
+    """Entry point of the app subprocess: serve SSDAS against the load-test database"""
+    db_params = json.loads(os.environ["SSDAS_LOADTEST_DB"])
+    ssdas.get_db = lambda: psycopg2.connect(**db_params)
+    ssdas.app.config["UPLOAD_FOLDER"] = os.environ["SSDAS_LOADTEST_UPLOADS"]
+
+    # Werkzeug logs every request to stderr from the handler threads, which
+    # floods the output and adds to the latencies being measured
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    server = make_server("127.0.0.1", port, ssdas.app, threaded=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def start_app_server(db_params, upload_dir):
+    """Run the app in its own interpreter and wait until it accepts connections"""
+    port = get_free_port()
+    env = dict(
+        os.environ,
+        SSDAS_LOADTEST_DB=json.dumps(db_params),
+        SSDAS_LOADTEST_UPLOADS=upload_dir,
+    )
+    proc = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--serve-app", str(port)],
+        cwd=BASE_DIR, env=env,
+    )
+
+    give_up = time.monotonic() + SERVER_START_TIMEOUT
+    while True:
+        if proc.poll() is not None:
+            raise RuntimeError(f"App server exited with code {proc.returncode} before accepting connections")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return proc, f"http://127.0.0.1:{port}"
+        except OSError:
+            if time.monotonic() > give_up:
+                stop_app_server(proc)
+                raise RuntimeError(f"App server did not start within {SERVER_START_TIMEOUT}s")
+            time.sleep(0.2)
+
+
+def stop_app_server(proc):
+    proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def build_upload_pool(rng):
+    """Pre-generate upload files so CSV building stays out of the timed run"""
+    return {
+        rows: [generate_sales_csv(rows, rng) for _ in range(UPLOAD_POOL_SIZE)]
+        for rows, _ in UPLOAD_SIZES
+    }
+
+
+# ---------- HTTP CLIENT ----------
+
+class NoRedirect(HTTPRedirectHandler):
+    # The app reports most failures as a redirect plus a flash message,
+    # so redirects are inspected rather than followed.
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+def encode_multipart(field, filename, content, content_type="text/csv"):
+    boundary = uuid.uuid4().hex
+    body = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode() + content + f"\r\n--{boundary}--\r\n".encode()
+    return body, f"multipart/form-data; boundary={boundary}"
+
+
+def timed_request(opener, url, data=None, headers=None):
+    """Send a request and return (status, location, content_type, elapsed_seconds)
+
+    Connection failures (resets, timeouts, truncated bodies) are returned with
+    the exception class name as the status so they are counted as errors.
+    """
+    req = Request(url, data=data, headers=headers or {})
+    start = time.perf_counter()
+    try:
+        try:
+            resp = opener.open(req, timeout=60)
+        except HTTPError as e:
+            # 3xx (with redirects disabled) and 4xx/5xx both land here
+            resp = e
+        resp.read()
+    except (OSError, http.client.HTTPException) as e:
+        return type(e).__name__, "", "", time.perf_counter() - start
+    elapsed = time.perf_counter() - start
+    return resp.status, resp.headers.get("Location", ""), resp.headers.get("Content-Type", ""), elapsed
+
+
+# ---------- VIRTUAL USERS ----------
+
+def run_virtual_user(base_url, user, upload_pool, deadline, stop, think_time, rng, stats, lock):
+    opener = build_opener(HTTPCookieProcessor(CookieJar()), NoRedirect())
+    analysis_ids = list(user["analysis_ids"])
+    actions = list(ACTION_WEIGHTS)
+    weights = [ACTION_WEIGHTS[a] for a in actions]
+
+    def record(route, status, ok, elapsed):
+        with lock:
+            if elapsed is not None:
+                stats[route]["latencies"].append(elapsed)
+            stats[route]["requests"] += 1
+            if not ok:
+                stats[route]["errors"] += 1
+                stats[route]["statuses"][str(status)] += 1
+
+    def login():
+        data = urlencode({"email": user["email"], "password": LOADTEST_PASSWORD}).encode()
+        status, location, _, elapsed = timed_request(
+            opener, f"{base_url}/login", data,
+            {"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        # Success redirects to the index page; bad credentials redirect back to /login
+        ok = status == 302 and urlparse(location).path == "/"
+        record("/login", status, ok, elapsed)
+
+    def perform(action):
+        if action == "login":
+            login()
+
+        elif action == "index":
+            status, _, _, elapsed = timed_request(opener, f"{base_url}/")
+            record("/", status, status == 200, elapsed)
+
+        elif action == "history":
+            status, _, _, elapsed = timed_request(opener, f"{base_url}/history")
+            record("/history", status, status == 200, elapsed)
+
+        elif action == "results" and analysis_ids:
+            analysis_id = rng.choice(analysis_ids)
+            status, _, _, elapsed = timed_request(opener, f"{base_url}/results/{analysis_id}")
+            record("/results/<id>", status, status == 200, elapsed)
+
+        elif action == "export_pdf" and analysis_ids:
+            analysis_id = rng.choice(analysis_ids)
+            status, _, content_type, elapsed = timed_request(opener, f"{base_url}/export_pdf/{analysis_id}")
+            record("/export_pdf/<id>", status, status == 200 and "pdf" in content_type, elapsed)
+
+        elif action == "upload":
+            sizes = [s for s, _ in UPLOAD_SIZES]
+            size_weights = [w for _, w in UPLOAD_SIZES]
+            rows = rng.choices(sizes, size_weights)[0]
+            filename = f"load_{uuid.uuid4().hex[:12]}.csv"
+            body, content_type = encode_multipart("file", filename, rng.choice(upload_pool[rows]))
+            status, location, _, elapsed = timed_request(
+                opener, f"{base_url}/upload", body, {"Content-Type": content_type},
+            )
+            ok = status == 302 and "/results/" in location
+            record("/upload", status, ok, elapsed)
+            if ok:
+                analysis_ids.append(int(urlparse(location).path.rstrip("/").rsplit("/", 1)[1]))
+
+    def perform_safely(action):
+        # A bug or unexpected exception in one action is recorded as an error
+        # for that route instead of silently ending this virtual user.
+        try:
+            perform(action)
+        except Exception as e:
+            record(ACTION_ROUTES[action], type(e).__name__, False, None)
+
+    perform_safely("login")
+
+    while time.monotonic() < deadline and not stop.is_set():
+        perform_safely(rng.choices(actions, weights)[0])
+
+        if think_time:
+            stop.wait(rng.uniform(0, think_time))
+
+
+# ---------- REPORTING ----------
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(stats, duration):
+    summary = {}
+    for route, data in sorted(stats.items()):
+        latencies = sorted(data["latencies"])
+        requests_made = data["requests"]
+        summary[route] = {
+            "requests": requests_made,
+            "errors": data["errors"],
+            "error_rate": round(data["errors"] / requests_made, 4) if requests_made else 0.0,
+            "throughput_rps": round(requests_made / duration, 2) if duration else 0.0,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+            "error_statuses": dict(data["statuses"]),
+        }
+    return summary
+
+
+def check_thresholds(summary, thresholds):
+    """Return a list of human-readable threshold breaches"""
+    breaches = []
+    for route, limits in thresholds.items():
+        result = summary.get(route)
+        if not result or not result["requests"]:
+            breaches.append(f"{route}: no requests recorded")
+            continue
+        for key in ("p95_ms", "p99_ms"):
+            if key in limits and result[key] > limits[key]:
+                breaches.append(f"{route}: {key} {result[key]} > {limits[key]}")
+        if "max_error_rate" in limits and result["error_rate"] > limits["max_error_rate"]:
+            breaches.append(f"{route}: error rate {result['error_rate']:.2%} > {limits['max_error_rate']:.2%}")
+    return breaches
+
+
+def print_report(summary, duration):
+    header = f"{'Route':<20}{'Reqs':>8}{'Err%':>8}{'RPS':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    print()
+    print(header)
+    print("-" * len(header))
+    total_requests = 0
+    total_errors = 0
+    for route, r in summary.items():
+        total_requests += r["requests"]
+        total_errors += r["errors"]
+        print(
+            f"{route:<20}{r['requests']:>8}{r['error_rate'] * 100:>7.1f}%{r['throughput_rps']:>8.1f}"
+            f"{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}{r['p99_ms']:>10.1f}"
+        )
+    print("-" * len(header))
+    overall_rps = total_requests / duration if duration else 0.0
+    overall_err = total_errors / total_requests if total_requests else 0.0
+    print(f"Total: {total_requests} requests in {duration:.1f}s ({overall_rps:.1f} req/s), {overall_err:.2%} errors")
+
+
+# ---------- MAIN ----------
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Load test the SSDAS Flask routes.")
+    parser.add_argument("--users", type=int, default=10, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=60, help="seconds of traffic to generate")
+    parser.add_argument("--analyses-per-user", type=int, default=20, help="seeded analyses per user")
+    parser.add_argument("--think-time", type=float, default=0.5, help="max random pause between requests (seconds)")
+    parser.add_argument("--dsn", help="use an existing PostgreSQL server instead of starting a disposable one")
+    parser.add_argument("--thresholds", help="JSON file overriding DEFAULT_THRESHOLDS per route")
+    parser.add_argument("--report", help="write the summary as JSON to this path")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for reproducible traffic")
+    # Internal: used when load_test.py re-launches itself as the app server
+    parser.add_argument("--serve-app", type=int, metavar="PORT", help=argparse.SUPPRESS)
+    return parser
+
+
+def load_thresholds(path):
+    """Merge a JSON override file into DEFAULT_THRESHOLDS, rejecting unknown routes and limits"""
+    thresholds = {route: dict(limits) for route, limits in DEFAULT_THRESHOLDS.items()}
+    with open(path) as f:
+        overrides = json.load(f)
+    if not isinstance(overrides, dict):
+        raise ValueError(f"{path}: expected an object mapping routes to limits")
+
+    for route, limits in overrides.items():
+        if route not in DEFAULT_THRESHOLDS:
+            raise ValueError(f"{path}: unknown route '{route}' (valid routes: {', '.join(DEFAULT_THRESHOLDS)})")
+        if not isinstance(limits, dict):
+            raise ValueError(f"{path}: limits for '{route}' must be an object")
+        for key, value in limits.items():
+            if key not in THRESHOLD_KEYS:
+                raise ValueError(f"{path}: unknown limit '{key}' for '{route}' (valid limits: {', '.join(THRESHOLD_KEYS)})")
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                raise ValueError(f"{path}: '{route}' {key} must be a non-negative number, got {value!r}")
+        thresholds[route].update(limits)
+    return thresholds
+
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.serve_app is not None:
+        return serve_app(args.serve_app)
+    rng = random.Random(args.seed)
+
+    thresholds = {route: dict(limits) for route, limits in DEFAULT_THRESHOLDS.items()}
+    if args.thresholds:
+        try:
+            thresholds = load_thresholds(args.thresholds)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+
+    data_dir = None
+    if args.dsn:
+        server_params = psycopg2.extensions.parse_dsn(args.dsn)
+    else:
+        print("Starting disposable PostgreSQL...")
+        data_dir, server_params = start_postgres()
+
+    dbname = f"ssdas_loadtest_{os.getpid()}"
+    upload_dir = tempfile.mkdtemp(prefix="ssdas_uploads_")
+    server_proc = None
+    stop = threading.Event()
+    workers = []
+
+    try:
+        db_params = create_database(server_params, dbname)
+        ssdas.get_db = lambda: psycopg2.connect(**db_params)
+
+        print(f"Seeding {args.users} users x {args.analyses_per_user} analyses...")
+        users = seed_database(args.users, args.analyses_per_user, rng)
+        upload_pool = build_upload_pool(rng)
+
+        server_proc, base_url = start_app_server(db_params, upload_dir)
+
+        print(f"Running {args.users} virtual users against {base_url} for {args.duration:.0f}s...")
+        stats = defaultdict(lambda: {"latencies": [], "requests": 0, "errors": 0, "statuses": defaultdict(int)})
+        lock = threading.Lock()
+        start = time.monotonic()
+        deadline = start + args.duration
+        for user in users:
+            worker = threading.Thread(
+                target=run_virtual_user,
+                args=(base_url, user, upload_pool, deadline, stop, args.think_time, random.Random(rng.random()), stats, lock),
+                daemon=True,
+            )
+            worker.start()
+            workers.append(worker)
+        for worker in workers:
+            worker.join()
+        elapsed = time.monotonic() - start
+
+        summary = summarize(stats, elapsed)
+        print_report(summary, elapsed)
+
+        if args.report:
+            with open(args.report, "w") as f:
+                json.dump({"duration_s": round(elapsed, 2), "users": args.users, "routes": summary}, f, indent=2)
+
+        breaches = check_thresholds(summary, thresholds)
+        if breaches:
+            print("\nThreshold breaches:")
+            for breach in breaches:
+                print(f"  - {breach}")
+            return 1
+        print("\nAll routes within thresholds.")
+        return 0
+
+    finally:
+        # Stop the virtual users before the server and database go away,
+        # otherwise an early exit leaves them hammering a dead port
+        stop.set()
+        for worker in workers:
+            worker.join()
+        if server_proc is not None:
+            stop_app_server(server_proc)
+        shutil.rmtree(upload_dir, ignore_errors=True)
+        if data_dir:
+            stop_postgres(data_dir)
+        else:
+            try:
+                drop_database(server_params, dbname)
+            except psycopg2.Error as e:
+                # Don't mask whatever ended the run; just say what was left behind
+                print(f"Warning: could not drop database {dbname}: {e}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())